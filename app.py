@@ -1,10 +1,11 @@
 import time
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Response
 from typing import Optional
 import uvicorn
 
 from config import setup_logging, load_environment, configure_gemini
 from models import SuccessResponse, ErrorResponse, HealthResponse, RecipeResponse
+from internal_models import RecipeData
 from utils import get_platform
 from scraper import (
     try_video_extraction,
@@ -154,12 +155,23 @@ async def scrape_recipe(
             data = translate_recipe(data, language, gemini_api_key)
             source = f"{source}-translated-{language}"
 
+        # Scraper-built RecipeData is trusted, while Gemini-produced (or
+        # translated) JSON still needs full validation
+        if isinstance(data, RecipeData):
+            recipe = RecipeResponse.build(data)
+        else:
+            recipe = RecipeResponse.model_validate(data)
+
         total_elapsed = time.time() - start_time
-        return SuccessResponse(
+        response = SuccessResponse.build(
             success=True,
             source=source,
             processing_time=round(total_elapsed, 3),
-            data=RecipeResponse(**data),
+            data=recipe,
+        )
+        # Serialize via pydantic-core directly instead of FastAPI's dict round-trip
+        return Response(
+            content=response.model_dump_json(), media_type="application/json"
         )
 
     except Exception as e:
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(slots=True, frozen=True)
+class ImageData:
+    """Image information produced by the scraper"""
+
+    url: str = ""
+    key: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class RecipeData:
+    """Recipe data produced by trusted scraper code (no validation)"""
+
+    title: str = ""
+    description: str = ""
+    prep_time: int = 0
+    cook_time: int = 0
+    total_time: int = 0
+    yields: int = 0
+    ingredients: List[str] = field(default_factory=list)
+    instructions: List[str] = field(default_factory=list)
+    image: ImageData = field(default_factory=ImageData)
+    url: str = ""
+    host: str = ""
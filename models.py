@@ -1,19 +1,39 @@
-from pydantic import BaseModel, Field
+from dataclasses import fields
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Optional
 
+from internal_models import RecipeData
+
+# These match pydantic v2's defaults; they are pinned so that a future change
+# in defaults cannot start revalidating (and copying) nested response models
+RESPONSE_MODEL_CONFIG = ConfigDict(
+    revalidate_instances="never",
+    validate_assignment=False,
+    extra="ignore",
+)
+
 
 class ImageInfo(BaseModel):
     """Image information model"""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     url: str = Field(
         ..., description="Image URL (S3 URL if uploaded, otherwise original)"
     )
     key: Optional[str] = Field(None, description="S3 key if uploaded to S3")
 
+    @classmethod
+    def build(cls, url: str, key: Optional[str] = None) -> "ImageInfo":
+        """Create from trusted data without running validation"""
+        return cls.model_construct(url=url, key=key)
+
 
 class RecipeResponse(BaseModel):
     """Standardized recipe data model"""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     title: str = Field(..., description="The title of the recipe")
     description: str = Field(..., description="A description of the recipe")
     prep_time: int = Field(..., description="Preparation time in minutes", ge=0)
@@ -28,10 +48,19 @@ class RecipeResponse(BaseModel):
     url: str = Field(..., description="Original recipe URL")
     host: str = Field(..., description="Website host name")
 
+    @classmethod
+    def build(cls, data: RecipeData) -> "RecipeResponse":
+        """Create from trusted scraper output without running validation"""
+        values = {f.name: getattr(data, f.name) for f in fields(data)}
+        values["image"] = ImageInfo.build(url=data.image.url, key=data.image.key)
+        return cls.model_construct(**values)
+
 
 class SuccessResponse(BaseModel):
     """Successful response model"""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     success: bool = Field(
         ..., example=True, description="Indicates if the request was successful"
     )
@@ -43,6 +72,15 @@ class SuccessResponse(BaseModel):
     )
     data: RecipeResponse = Field(..., description="The extracted recipe data")
 
+    @classmethod
+    def build(
+        cls, success: bool, source: str, processing_time: float, data: RecipeResponse
+    ) -> "SuccessResponse":
+        """Create from trusted values without running validation"""
+        return cls.model_construct(
+            success=success, source=source, processing_time=processing_time, data=data
+        )
+
 
 class ErrorResponse(BaseModel):
     """Error response model"""
@@ -3,24 +3,152 @@ S3 Upload Utility for Recipe Scraper
 Handles uploading images from URLs to AWS S3
 """
 
+import io
 import os
+import time
+import hashlib
+import asyncio
+import functools
 import logging
-import requests
+import httpx
 import boto3
-from datetime import datetime
-from urllib.parse import urlparse
-from typing import Dict, Optional
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from typing import Dict, List, Optional
 import mimetypes
 
-logger = logging.getLogger(__name__)
+# Optional: install aioboto3 to enable concurrent batch uploads. It is not in
+# requirements.txt because aiobotocore pins botocore to a narrow range
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
 
+logger = logging.getLogger(__name__)
 
-# Initialize S3 client
+# Load the mime type database now rather than during the first upload request
+mimetypes.init()
+
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Fail fast on unreachable hosts while still allowing slow image bodies
+_HTTP_TIMEOUT = httpx.Timeout(27.0, connect=3.05)
+
+# Gateway errors worth retrying for idempotent requests (body reads are not retried)
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "HEAD"})
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.3
+
+
+class _RetryTransport(httpx.HTTPTransport):
+    """HTTP transport that retries connect errors and gateway error statuses"""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = super().handle_request(request)
+            if (
+                attempt == _RETRY_TOTAL
+                or request.method not in _RETRY_METHODS
+                or response.status_code not in _RETRY_STATUSES
+            ):
+                return response
+            response.close()
+            time.sleep(_RETRY_BACKOFF * 2**attempt)
+
+
+class _AsyncRetryTransport(httpx.AsyncHTTPTransport):
+    """Async HTTP transport that retries connect errors and gateway error statuses"""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(_RETRY_TOTAL + 1):
+            response = await super().handle_async_request(request)
+            if (
+                attempt == _RETRY_TOTAL
+                or request.method not in _RETRY_METHODS
+                or response.status_code not in _RETRY_STATUSES
+            ):
+                return response
+            await response.aclose()
+            await asyncio.sleep(_RETRY_BACKOFF * 2**attempt)
+
+
+# Shared HTTP/2 client so image downloads reuse pooled, multiplexed connections
+_client = httpx.Client(
+    headers=_HTTP_HEADERS,
+    timeout=_HTTP_TIMEOUT,
+    follow_redirects=True,
+    transport=_RetryTransport(http2=True, limits=_HTTP_LIMITS, retries=_RETRY_TOTAL),
+)
+
+# Multipart settings for streaming image bodies to S3
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+# Maximum number of in-flight downloads/uploads for batch uploads
+BATCH_CONCURRENCY = 32
+
+
+class _ResponseStream(io.RawIOBase):
+    """Read-only file object over a streaming httpx response body"""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+# Environment lookups are cached lazily rather than at import time because
+# app.py loads the .env file after this module has been imported. Missing
+# values are not cached so later calls can pick them up.
+_bucket_name: Optional[str] = None
+_s3_client = None
+
+
+def _get_bucket_name() -> Optional[str]:
+    """Return the configured S3 bucket name"""
+    global _bucket_name
+    if _bucket_name is None:
+        _bucket_name = os.getenv("AWS_BUCKET_NAME") or None
+    return _bucket_name
+
+
+@functools.lru_cache(maxsize=1)
+def _get_aws_region() -> str:
+    """Return the configured AWS region"""
+    return os.getenv("AWS_REGION", "us-east-1")
+
+
+# Initialize S3 client once per process (failures are retried on the next call)
 def get_s3_client():
     """Create and return S3 client with credentials from environment"""
+    global _s3_client
+    if _s3_client is not None:
+        return _s3_client
+
     aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
     aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-    aws_region = os.getenv("AWS_REGION", "us-east-1")
+    aws_region = _get_aws_region()
 
     if not aws_access_key or not aws_secret_key:
         logger.warning("AWS credentials not configured")
@@ -34,52 +162,73 @@ def get_s3_client():
             region_name=aws_region,
         )
         logger.debug("S3 client initialized successfully")
+        _s3_client = s3_client
         return s3_client
     except Exception as e:
         logger.error(f"Failed to initialize S3 client: {str(e)}")
         return None
 
 
-def generate_unique_filename(extension: str = "") -> str:
-    """Generate a unique filename with timestamp and random hex"""
-    timestamp = int(datetime.now().timestamp() * 1000)
-    hex_timestamp = hex(timestamp)[2:]
-    import random
+# Allowed image formats
+ALLOWED_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "webp", "gif", "svg"})
 
-    random_hex = hex(random.randint(0, 0xFFFFF))[2:].zfill(5)
 
-    if extension:
-        return f"{hex_timestamp}-{random_hex}.{extension}"
-    return f"{hex_timestamp}-{random_hex}"
+@functools.lru_cache(maxsize=32)
+def _guess_ext(content_type: str) -> Optional[str]:
+    """Guess a file extension (without dot) for a content type"""
+    ext = mimetypes.guess_extension(content_type)
+    if not ext:
+        return None
+    ext = ext.lstrip(".")
+    if ext == "jpe":
+        ext = "jpg"
+    return ext
 
 
 def get_extension_from_url(url: str, content_type: Optional[str] = None) -> str:
     """Extract file extension from URL or content type"""
-    # Allowed image formats
-    ALLOWED_EXTENSIONS = ["jpg", "jpeg", "png", "webp", "gif", "svg"]
-
-    # Try to get extension from URL
-    parsed_url = urlparse(url)
-    path = parsed_url.path
-    if "." in path:
-        ext = path.split(".")[-1].lower()
+    # Try to get extension from the URL path (ignoring query and fragment)
+    end = len(url)
+    query = url.find("?")
+    if query != -1:
+        end = query
+    fragment = url.find("#", 0, end)
+    if fragment != -1:
+        end = fragment
+    dot = url.rfind(".", 0, end)
+    if dot > url.rfind("/", 0, end):
+        ext = url[dot + 1 : end].lower()
         if ext in ALLOWED_EXTENSIONS:
             return ext
 
     # Try to get from content type
     if content_type:
-        ext = mimetypes.guess_extension(content_type)
-        if ext:
-            ext = ext.lstrip(".")
-            if ext == "jpe":
-                ext = "jpg"
-            if ext in ALLOWED_EXTENSIONS:
-                return ext
+        ext = _guess_ext(content_type)
+        if ext in ALLOWED_EXTENSIONS:
+            return ext
 
     # Default to jpg
     return "jpg"
 
 
+def generate_url_filename(image_url: str) -> str:
+    """Generate a deterministic filename from a hash of the image URL"""
+    digest = hashlib.blake2b(image_url.encode(), digest_size=12).hexdigest()
+    return f"{digest}.{get_extension_from_url(image_url)}"
+
+
+def _s3_object_exists(s3_client, bucket_name: str, key: str) -> bool:
+    """Check whether an object already exists in S3"""
+    try:
+        s3_client.head_object(Bucket=bucket_name, Key=key)
+        return True
+    except ClientError as e:
+        error_code = e.response.get("Error", {}).get("Code")
+        if error_code not in ("404", "NoSuchKey", "NotFound"):
+            logger.warning(f"HEAD request failed for {key}: {error_code}")
+        return False
+
+
 def upload_image_from_url(
     image_url: str, s3_client=None, bucket_name: str = None
 ) -> Dict[str, str]:
@@ -113,54 +262,47 @@ def upload_image_from_url(
 
     # Get bucket name
     if not bucket_name:
-        bucket_name = os.getenv("AWS_BUCKET_NAME")
+        bucket_name = _get_bucket_name()
 
     if not bucket_name:
         logger.error("AWS_BUCKET_NAME not configured")
         return {"success": False, "url": image_url, "key": ""}
 
+    # Same source URL always maps to the same key so re-scrapes can skip the upload
+    key = f"uploads/scraper/{generate_url_filename(image_url)}"
+    s3_url = f"https://{bucket_name}.s3.{_get_aws_region()}.amazonaws.com/{key}"
+
     try:
+        if _s3_object_exists(s3_client, bucket_name, key):
+            logger.info(f"Image already in S3, skipping upload: {key}")
+            return {"success": True, "url": s3_url, "key": key}
+
         logger.debug(f"Downloading image from URL: {image_url}")
 
         # Download image
-        response = requests.get(
-            image_url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
-            timeout=30,
-            stream=True,
-        )
-        response.raise_for_status()
+        with _client.stream("GET", image_url) as response:
+            response.raise_for_status()
 
-        # Get content type and extension
-        content_type = response.headers.get("Content-Type", "image/jpeg")
-        extension = get_extension_from_url(image_url, content_type)
+            # Get content type
+            content_type = response.headers.get("Content-Type", "image/jpeg")
 
-        # Generate unique filename
-        filename = generate_unique_filename(extension)
-        key = f"uploads/scraper/{filename}"
+            logger.debug(f"Uploading to S3: bucket={bucket_name}, key={key}")
 
-        logger.debug(f"Uploading to S3: bucket={bucket_name}, key={key}")
-
-        # Upload to S3
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=key,
-            Body=response.content,
-            ContentType=content_type,
-            ACL="public-read",
-        )
-
-        # Construct URL
-        aws_region = os.getenv("AWS_REGION", "us-east-1")
-        s3_url = f"https://{bucket_name}.s3.{aws_region}.amazonaws.com/{key}"
+            # Stream the (decoded) body straight from the socket to S3. The
+            # buffered reader fills each read fully, as multipart parts require
+            s3_client.upload_fileobj(
+                Fileobj=io.BufferedReader(_ResponseStream(response)),
+                Bucket=bucket_name,
+                Key=key,
+                ExtraArgs={"ContentType": content_type, "ACL": "public-read"},
+                Config=_TRANSFER_CONFIG,
+            )
 
         logger.info(f"Successfully uploaded image to S3: {key}")
 
         return {"success": True, "url": s3_url, "key": key}
 
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to download image from URL: {str(e)}")
         return {"success": False, "url": image_url, "key": ""}
 
@@ -191,3 +333,124 @@ def upload_image_if_configured(image_url: str) -> Dict[str, str]:
     else:
         # If upload failed, return original URL
         return {"url": image_url, "key": ""}
+
+
+def _upload_images_sequentially(
+    image_urls: List[str], bucket_name: Optional[str]
+) -> List[Dict[str, str]]:
+    """Upload images one at a time with the shared boto3 client"""
+    s3_client = get_s3_client()
+    return [
+        upload_image_from_url(url, s3_client=s3_client, bucket_name=bucket_name)
+        for url in image_urls
+    ]
+
+
+async def upload_images_from_urls_async(
+    image_urls: List[str], bucket_name: str = None
+) -> List[Dict[str, str]]:
+    """
+    Download several images and upload them to S3 concurrently
+
+    Uses httpx + aioboto3 when aioboto3 is installed (optional), otherwise runs
+    upload_image_from_url for each URL in turn in a worker thread.
+
+    Returns:
+        List of dicts in the same order as image_urls, each shaped like
+        the result of upload_image_from_url
+    """
+    if not image_urls:
+        return []
+
+    if not bucket_name:
+        bucket_name = _get_bucket_name()
+
+    if (
+        aioboto3 is None
+        or not bucket_name
+        or not os.getenv("AWS_ACCESS_KEY_ID")
+        or not os.getenv("AWS_SECRET_ACCESS_KEY")
+    ):
+        # Sequential path also handles the missing-configuration cases
+        return await asyncio.to_thread(
+            _upload_images_sequentially, image_urls, bucket_name
+        )
+
+    aws_region = _get_aws_region()
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    s3_session = aioboto3.Session(
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=aws_region,
+    )
+
+    async def _one(http_client, s3_client, image_url: str) -> Dict[str, str]:
+        if not image_url:
+            return {"success": False, "url": "", "key": ""}
+
+        key = f"uploads/scraper/{generate_url_filename(image_url)}"
+        s3_url = f"https://{bucket_name}.s3.{aws_region}.amazonaws.com/{key}"
+
+        async with semaphore:
+            try:
+                try:
+                    await s3_client.head_object(Bucket=bucket_name, Key=key)
+                    logger.info(f"Image already in S3, skipping upload: {key}")
+                    return {"success": True, "url": s3_url, "key": key}
+                except ClientError as e:
+                    error_code = e.response.get("Error", {}).get("Code")
+                    if error_code not in ("404", "NoSuchKey", "NotFound"):
+                        logger.warning(f"HEAD request failed for {key}: {error_code}")
+
+                logger.debug(f"Downloading image from URL: {image_url}")
+                response = await http_client.get(image_url)
+                response.raise_for_status()
+                content_type = response.headers.get("Content-Type", "image/jpeg")
+                body = response.content
+
+                logger.debug(f"Uploading to S3: bucket={bucket_name}, key={key}")
+                await s3_client.put_object(
+                    Bucket=bucket_name,
+                    Key=key,
+                    Body=body,
+                    ContentType=content_type,
+                    ACL="public-read",
+                )
+
+                logger.info(f"Successfully uploaded image to S3: {key}")
+                return {"success": True, "url": s3_url, "key": key}
+
+            except httpx.HTTPError as e:
+                logger.error(f"Failed to download image from URL: {str(e)}")
+                return {"success": False, "url": image_url, "key": ""}
+
+            except Exception as e:
+                logger.error(f"Failed to upload image to S3: {str(e)}")
+                return {"success": False, "url": image_url, "key": ""}
+
+    async with httpx.AsyncClient(
+        headers=_HTTP_HEADERS,
+        timeout=_HTTP_TIMEOUT,
+        follow_redirects=True,
+        transport=_AsyncRetryTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=BATCH_CONCURRENCY),
+            retries=_RETRY_TOTAL,
+        ),
+    ) as http_client:
+        async with s3_session.client("s3") as s3_client:
+            return await asyncio.gather(
+                *[_one(http_client, s3_client, url) for url in image_urls]
+            )
+
+
+def upload_images_from_urls(
+    image_urls: List[str], bucket_name: str = None
+) -> List[Dict[str, str]]:
+    """
+    Synchronous wrapper around upload_images_from_urls_async
+
+    Must not be called from a running event loop; async callers should
+    await upload_images_from_urls_async directly.
+    """
+    return asyncio.run(upload_images_from_urls_async(image_urls, bucket_name))
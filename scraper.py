@@ -1,13 +1,15 @@
 import logging
 import json
+from dataclasses import asdict
 import requests
 from bs4 import BeautifulSoup
 import google.generativeai as genai
 from recipe_scrapers import scrape_me
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 from urllib.parse import urlparse
 
 from config import HEADERS, UNIFIED_RECIPE_FORMAT
+from internal_models import ImageData, RecipeData
 from utils import parse_time_to_minutes, parse_servings_to_int
 from s3_upload import upload_image_if_configured
 
@@ -120,47 +122,42 @@ Return ONLY the JSON object."""
         raise
 
 
-def format_recipe_scrapers_data(scraper_data: Dict) -> Dict:
+def format_recipe_scrapers_data(scraper_data: Dict) -> RecipeData:
     """Format recipe-scrapers data to unified format."""
-    unified = UNIFIED_RECIPE_FORMAT.copy()
-
-    unified["title"] = scraper_data.get("title", "")
-    unified["description"] = scraper_data.get("description", "")
-    unified["prep_time"] = parse_time_to_minutes(scraper_data.get("prep_time", ""))
-    unified["cook_time"] = parse_time_to_minutes(scraper_data.get("cook_time", ""))
-    unified["total_time"] = parse_time_to_minutes(scraper_data.get("total_time", ""))
-
     yields_str = scraper_data.get("yields", "") or scraper_data.get("servings", "")
-    unified["yields"] = parse_servings_to_int(yields_str)
 
     image_url = scraper_data.get("image", "")
     uploaded_image = upload_image_if_configured(image_url)
-    unified["image"] = {"url": uploaded_image["url"], "key": uploaded_image["key"]}
-
-    unified["url"] = scraper_data.get("url", "")
-    unified["host"] = scraper_data.get("host", "")
 
     ingredients = scraper_data.get("ingredients", [])
     if isinstance(ingredients, list):
-        unified["ingredients"] = [
-            str(ingredient) for ingredient in ingredients if ingredient
-        ]
+        ingredients = [str(ingredient) for ingredient in ingredients if ingredient]
     else:
-        unified["ingredients"] = [str(ingredients)] if ingredients else []
+        ingredients = [str(ingredients)] if ingredients else []
 
     instructions = scraper_data.get("instructions", "")
     if isinstance(instructions, list):
-        unified["instructions"] = [
-            str(instruction) for instruction in instructions if instruction
-        ]
+        instructions = [str(instruction) for instruction in instructions if instruction]
     elif isinstance(instructions, str):
-        unified["instructions"] = [
+        instructions = [
             inst.strip() for inst in instructions.split("\n") if inst.strip()
         ]
     else:
-        unified["instructions"] = []
-
-    return unified
+        instructions = []
+
+    return RecipeData(
+        title=scraper_data.get("title") or "",
+        description=scraper_data.get("description") or "",
+        prep_time=parse_time_to_minutes(scraper_data.get("prep_time", "")),
+        cook_time=parse_time_to_minutes(scraper_data.get("cook_time", "")),
+        total_time=parse_time_to_minutes(scraper_data.get("total_time", "")),
+        yields=parse_servings_to_int(yields_str),
+        ingredients=ingredients,
+        instructions=instructions,
+        image=ImageData(url=uploaded_image["url"], key=uploaded_image["key"]),
+        url=scraper_data.get("url") or "",
+        host=scraper_data.get("host") or "",
+    )
 
 
 def format_with_gemini(
@@ -296,7 +293,7 @@ def validate_recipe_structure(recipe_data: Dict) -> Dict:
     return validated
 
 
-def try_recipe_scraper(url: str) -> Dict:
+def try_recipe_scraper(url: str) -> RecipeData:
     """Attempt to scrape using recipe-scrapers package."""
     try:
         scraper = scrape_me(url)
@@ -511,12 +508,17 @@ Return ONLY valid JSON:"""
 
 
 def translate_recipe(
-    recipe_data: Dict, target_language: str, gemini_api_key: str
-) -> Dict:
+    recipe_data: Union[Dict, RecipeData], target_language: str, gemini_api_key: str
+) -> Union[Dict, RecipeData]:
     """Translate recipe to target language if different from current language."""
     if not gemini_api_key:
         raise ValueError("Gemini API key is required for translation")
 
+    # Untranslated recipes are returned as-is; translated ones become dicts
+    original_data = recipe_data
+    if isinstance(recipe_data, RecipeData):
+        recipe_data = asdict(recipe_data)
+
     # Detect current language from recipe title and description
     sample_text = f"{recipe_data.get('title', '')} {recipe_data.get('description', '')}"
     current_language = detect_language(sample_text, gemini_api_key)
@@ -524,7 +526,7 @@ def translate_recipe(
     # Skip translation if languages match
     if current_language.lower() == target_language.lower():
         logger.info(f"Recipe is already in {target_language}, skipping translation")
-        return recipe_data
+        return original_data
 
     translatable_data = {
         "title": recipe_data.get("title", ""),
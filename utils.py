@@ -2,6 +2,25 @@ import re
 from typing import Union, Literal
 from urllib.parse import urlparse
 
+_COLON_RE = re.compile(r"\d+:\d{1,2}(?::\d{1,2})?")
+_ISO_RE = re.compile(
+    r"^pt(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m)?(?:(\d+(?:\.\d+)?)s)?$"
+)
+_UNIT_RE = re.compile(
+    r"(?P<num>\d+(?:\.\d+)?)\s*"
+    r"(?P<unit>hours?|hrs?|hr|h|minutes?|mins?|min|m|seconds?|secs?|sec|s)\b"
+)
+_COMPACT_HM_RE = re.compile(r"(\d+(?:\.\d+)?)h\s*(\d+(?:\.\d+)?)m")
+_NUM_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_SERVINGS_RE = re.compile(r"(\d+(?:\.\d+)?)(?:\s*[-–—to]\s*(\d+))?")
+_TIME_TRANS = str.maketrans({",": " ", "\u2013": "-", "\u2014": "-"})
+_PLATFORM_DOMAINS = (
+    ("tiktok.com", "tiktok"),
+    ("youtube.com", "youtube"),
+    ("youtu.be", "youtube"),
+)
+
+
 def parse_time_to_minutes(time_str: Union[str, int, float, None]) -> int:
     """
     Convert a variety of time strings to integer minutes.
@@ -10,13 +29,17 @@ def parse_time_to_minutes(time_str: Union[str, int, float, None]) -> int:
         return 0
     if isinstance(time_str, (int, float)):
         return int(round(float(time_str)))
-    s = str(time_str).strip().lower()
+    s = str(time_str)
+    # Fast path for plain integers such as "30"
+    if s.isascii() and s.isdigit():
+        return int(s)
+    s = s.strip().lower()
     if not s:
         return 0
     if s.isdigit():
         return int(s)
     total_minutes = 0.0
-    if re.fullmatch(r"\d+:\d{1,2}(?::\d{1,2})?", s):
+    if _COLON_RE.fullmatch(s):
         parts = [int(p) for p in s.split(":")]
         if len(parts) == 2:
             hours, minutes = parts
@@ -25,39 +48,29 @@ def parse_time_to_minutes(time_str: Union[str, int, float, None]) -> int:
             hours, minutes, seconds = parts
         total_minutes = hours * 60 + minutes + (seconds / 60.0)
         return int(round(total_minutes))
-    s = s.replace(",", " ")
-    s = s.replace("\u2013", "-")
-    s = s.replace("\u2014", "-")
-    m_iso = re.match(
-        r"^pt(?:(\d+(?:\.\d+)?)h)?(?:(\d+(?:\.\d+)?)m)?(?:(\d+(?:\.\d+)?)s)?$", s
-    )
+    s = s.translate(_TIME_TRANS)
+    m_iso = _ISO_RE.match(s)
     if m_iso:
         h = float(m_iso.group(1)) if m_iso.group(1) else 0.0
         mm = float(m_iso.group(2)) if m_iso.group(2) else 0.0
         sec = float(m_iso.group(3)) if m_iso.group(3) else 0.0
         total_minutes = h * 60.0 + mm + sec / 60.0
         return int(round(total_minutes))
-    hour_pattern = re.compile(r"(\d+(?:\.\d+)?)\s*(?:hours?|hrs?|hr|h)\b")
-    for m in hour_pattern.finditer(s):
-        total_minutes += float(m.group(1)) * 60.0
-    minute_pattern = re.compile(r"(\d+(?:\.\d+)?)\s*(?:minutes?|mins?|min|m)\b")
-    for m in minute_pattern.finditer(s):
-        total_minutes += float(m.group(1))
-    second_pattern = re.compile(r"(\d+(?:\.\d+)?)\s*(?:seconds?|secs?|sec|s)\b")
-    for m in second_pattern.finditer(s):
-        total_minutes += float(m.group(1)) / 60.0
+    for m in _UNIT_RE.finditer(s):
+        unit = m.group("unit")[0]
+        value = float(m.group("num"))
+        if unit == "h":
+            total_minutes += value * 60.0
+        elif unit == "m":
+            total_minutes += value
+        else:
+            total_minutes += value / 60.0
     if total_minutes == 0.0:
-        compact_hm = re.findall(r"(\d+(?:\.\d+)?)h\s*(\d+(?:\.\d+)?)m", s)
+        compact_hm = _COMPACT_HM_RE.findall(s)
         for h, mm in compact_hm:
             total_minutes += float(h) * 60.0 + float(mm)
-        compact_h = re.findall(r"(\d+(?:\.\d+)?)h\b", s)
-        for h in compact_h:
-            total_minutes += float(h) * 60.0
-        compact_m = re.findall(r"(\d+(?:\.\d+)?)m\b", s)
-        for mm in compact_m:
-            total_minutes += float(mm)
     if total_minutes == 0.0:
-        number_pattern = re.search(r"(\d+(?:\.\d+)?)", s)
+        number_pattern = _NUM_RE.search(s)
         if number_pattern:
             total_minutes = float(number_pattern.group(1))
     return int(round(total_minutes))
@@ -71,15 +84,22 @@ def parse_servings_to_int(servings_str: Union[str, int, float, None]) -> int:
         return 0
     if isinstance(servings_str, (int, float)):
         return int(round(float(servings_str)))
-    s = str(servings_str).strip().lower()
+    s = str(servings_str)
+    # Fast path for plain integers such as "30"
+    if s.isascii() and s.isdigit():
+        return int(s)
+    s = s.strip().lower()
     if not s:
         return 0
     if s.isdigit():
         return int(s)
-    range_match = re.search(r"(\d+)\s*[-–—to]\s*(\d+)", s)
-    if range_match:
-        return int(range_match.group(1))
-    number_match = re.search(r"(\d+(?:\.\d+)?)", s)
+    # Prefer the lower bound of the first range, otherwise the first number
+    number_match = None
+    for m in _SERVINGS_RE.finditer(s):
+        if m.group(2):
+            return int(round(float(m.group(1))))
+        if number_match is None:
+            number_match = m
     if number_match:
         return int(round(float(number_match.group(1))))
     return 0
@@ -89,9 +109,15 @@ def get_platform(url: str) -> Literal["tiktok", "youtube", "website"]:
     """
     Detect the platform from URL.
     """
-    url_lower = url.lower()
-    if "tiktok.com" in url_lower:
-        return "tiktok"
-    if "youtube.com" in url_lower or "youtu.be" in url_lower:
-        return "youtube"
+    # Parse scheme-less URLs such as "youtube.com/watch?v=x" as host + path
+    if "://" not in url:
+        url = "//" + url
+    try:
+        host = (urlparse(url).hostname or "").rstrip(".")
+    except ValueError:
+        # Malformed URLs (e.g. "http://[abc") are left to the website scrapers
+        return "website"
+    for domain, platform in _PLATFORM_DOMAINS:
+        if host == domain or host.endswith("." + domain):
+            return platform
     return "website"
@@ -3,24 +3,23 @@
 Quick validation script to check if the code structure is correct
 """
 
+import os
 import sys
 import ast
+from concurrent.futures import ProcessPoolExecutor
 
 
-def check_syntax(file_path):
-    """Check if a Python file has valid syntax"""
+def parse_file(file_path):
+    """Parse a Python file and return (is_valid, message)"""
     try:
         with open(file_path, "r") as f:
             code = f.read()
         ast.parse(code)
-        print(f"✓ {file_path}: Valid syntax")
-        return True
+        return True, f"✓ {file_path}: Valid syntax"
     except SyntaxError as e:
-        print(f"✗ {file_path}: Syntax error at line {e.lineno}: {e.msg}")
-        return False
+        return False, f"✗ {file_path}: Syntax error at line {e.lineno}: {e.msg}"
     except Exception as e:
-        print(f"✗ {file_path}: Error: {str(e)}")
-        return False
+        return False, f"✗ {file_path}: Error: {str(e)}"
 
 
 if __name__ == "__main__":
@@ -31,13 +30,17 @@ if __name__ == "__main__":
         "app.py",
         "utils.py",
         "s3_upload.py",
+        "internal_models.py",
     ]
 
     print("Checking Python syntax...\n")
     all_valid = True
-    for file in files_to_check:
-        if not check_syntax(file):
-            all_valid = False
+    # Parse files in parallel; results are printed in the original order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for is_valid, message in executor.map(parse_file, files_to_check):
+            print(message)
+            if not is_valid:
+                all_valid = False
 
     print("\n" + "=" * 50)
     if all_valid: